@@ -1,4 +1,35 @@
 import random
+import sys
+
+_rand = random.random
+
+# Combat messages are queued here and written in one go by flush_log().
+# Set SILENT to drop them entirely, e.g. for headless simulations.
+SILENT = False
+_LOG = []
+
+# Bits of Character._active_mask, one per status effect.
+EMPOWERED = 1
+WEAKENED = 2
+SHIELDED = 4
+VULNERABLE = 8
+EVADE_BOOST = 16
+SLOWED = 32
+STUNNED = 64
+
+
+def log(msg):
+    """Queue a combat message for the next flush_log(). No-op when SILENT."""
+    if not SILENT:
+        _LOG.append(msg)
+
+
+def flush_log():
+    """Write all queued combat messages to stdout and clear the queue."""
+    if _LOG:
+        if not SILENT:
+            sys.stdout.write("\n".join(_LOG) + "\n")
+        _LOG.clear()
 
 
 class Character:
@@ -6,8 +37,66 @@ class Character:
     Base class for all character types in the RPG.
     Manages core attributes like health, attack, defense, evasion, abilities, and status effects.
     Supports buffs, debuffs, cooldowns, and turn-based updates.
+
+    Status effects are stored as flat slots rather than a dict: ``stunned``
+    holds a remaining duration, and every other status has a ``<name>_v``
+    (value) and ``<name>_d`` (duration) pair. A negative duration is permanent.
+    ``_active_mask`` has one bit set per active status so the common case of
+    no effects in play can skip the status math entirely.
     """
 
+    __slots__ = (
+        "name",
+        "health",
+        "max_health",
+        "attack_power",
+        "defense",
+        "evasion_chance",
+        "cached_attack_roll",
+        "_roll_turn",
+        "_cached_roll_turn",
+        "stunned",
+        "weakened_v",
+        "weakened_d",
+        "vulnerable_v",
+        "vulnerable_d",
+        "slowed_v",
+        "slowed_d",
+        "shielded_v",
+        "shielded_d",
+        "empowered_v",
+        "empowered_d",
+        "evade_boost_v",
+        "evade_boost_d",
+        "_active_mask",
+        "abilities",
+        "_ability_names",
+        "_ability_display",
+        "_cd_index",
+        "_cds",
+        "_ready",
+    )
+
+    _TUPLE_STATUSES = (
+        "weakened",
+        "vulnerable",
+        "slowed",
+        "shielded",
+        "empowered",
+        "evade_boost",
+    )
+    _INT_STATUSES = ("stunned",)
+    # Status name -> (mask bit, value slot, duration slot) for string callers.
+    _STATUS_LAYOUT = {
+        "stunned": (STUNNED, None, "stunned"),
+        "weakened": (WEAKENED, "weakened_v", "weakened_d"),
+        "vulnerable": (VULNERABLE, "vulnerable_v", "vulnerable_d"),
+        "slowed": (SLOWED, "slowed_v", "slowed_d"),
+        "shielded": (SHIELDED, "shielded_v", "shielded_d"),
+        "empowered": (EMPOWERED, "empowered_v", "empowered_d"),
+        "evade_boost": (EVADE_BOOST, "evade_boost_v", "evade_boost_d"),
+    }
+
     def __init__(self, name, health, attack_power, defense, evasion_chance, abilities):
         """
         Initialize a character with core stats and abilities.
@@ -23,71 +112,124 @@ class Character:
         self.name = name
         self.health = health
         self.attack_power = attack_power
+        # The cached roll is valid while _cached_roll_turn matches _roll_turn;
+        # each attack action advances _roll_turn so the next one re-rolls.
         self.cached_attack_roll = None
+        self._roll_turn = 0
+        self._cached_roll_turn = -1
         self.defense = defense
         self.evasion_chance = evasion_chance
         self.max_health = health
 
-        self.status_effects = {
-            "stunned": 0,
-            "weakened": (0, 0),
-            "vulnerable": (0, 0),
-            "slowed": (0, 0),
-            "shielded": (0, 0),
-            "empowered": (0, 0),
-            "evade_boost": (0, 0),
-        }
+        self.stunned = 0
+        self.weakened_v = self.weakened_d = 0
+        self.vulnerable_v = self.vulnerable_d = 0
+        self.slowed_v = self.slowed_d = 0
+        self.shielded_v = self.shielded_d = 0
+        self.empowered_v = self.empowered_d = 0
+        self.evade_boost_v = self.evade_boost_d = 0
+        self._active_mask = 0
 
         self.abilities = abilities
-        self.cooldowns = {name: 0 for name in abilities}
+        self._ability_names = tuple(abilities)
+        self._ability_display = tuple(
+            (
+                i,
+                name,
+                info["cooldown"],
+                info.get("desc", "No description."),
+                name.replace("_", " ").title(),
+            )
+            for i, (name, info) in enumerate(abilities.items(), 1)
+        )
+        # Remaining cooldowns, aligned with _ability_names.
+        names = self._ability_names
+        self._cd_index = {name: i for i, name in enumerate(names)}
+        self._cds = [0] * len(names)
+        # Names of abilities that are off cooldown, kept in sync with _cds.
+        self._ready = set(names)
 
     def has_status(self, status_name):
-        """Return True if a status is currently active (duration > 0)."""
-        effect = self.status_effects.get(status_name)
-        return effect > 0 if isinstance(effect, int) else effect[1] > 0
+        """Return True if a status is currently active (nonzero duration)."""
+        return getattr(self, Character._STATUS_LAYOUT[status_name][2]) != 0
 
     def apply_status(self, name, value, duration):
-        """Apply a status effect with a value and duration."""
-        self.status_effects[name] = (value, duration)
+        """
+        Apply a status effect with a value and duration.
+        Stuns carry no value, so only the duration is stored for them.
+        """
+        bit, value_slot, duration_slot = Character._STATUS_LAYOUT[name]
+        if duration:
+            self._active_mask |= bit
+        else:
+            self._active_mask &= ~bit
+
+        if value_slot is not None:
+            setattr(self, value_slot, value)
+        setattr(self, duration_slot, duration)
 
     def try_evade(self, attacker_name=""):
         """Returns True if the character evades the incoming attack."""
-        if random.random() < self.get_effective_evasion():
+        return self._roll_evade(self.get_effective_evasion(), attacker_name)
+
+    def _roll_evade(self, evasion, attacker_name="", _rand=_rand):
+        """
+        Roll one evade attempt against an already computed evasion rate.
+        Lets multi-hit attacks read evasion once and roll each hit separately.
+        """
+        if _rand() < evasion:
             attacker_str = f"{attacker_name}'s " if attacker_name else ""
-            print(f"{self.name} evaded {attacker_str}attack!")
+            log(f"{self.name} evaded {attacker_str}attack!")
             return True
         return False
 
+    def _roll_attack(self, _rand=_rand):
+        """Roll a fresh attack value between attack_power and attack_power + 5."""
+        return self.attack_power + int(_rand() * 6)
+
+    def _current_roll(self):
+        """Return this attack action's roll, re-rolling once the action has advanced."""
+        if self._cached_roll_turn != self._roll_turn:
+            self.cached_attack_roll = self._roll_attack()
+            self._cached_roll_turn = self._roll_turn
+        return self.cached_attack_roll
+
     def get_effective_attack(self):
         """Return current attack power including random roll and status effects."""
-        base = self.attack_power
-        if self.cached_attack_roll is None:
-            self.cached_attack_roll = random.randint(base, base + 5)
-
-        atk = self.cached_attack_roll
-        if self.has_status("empowered"):
-            atk += self.status_effects["empowered"][0]
-        if self.has_status("weakened"):
-            atk -= self.status_effects["weakened"][0]
-        return max(1, atk)
+        roll = self._current_roll()
+        if not self._active_mask & (EMPOWERED | WEAKENED):
+            return roll
+
+        atk = (
+            roll
+            + (self.empowered_v if self.empowered_d else 0)
+            - (self.weakened_v if self.weakened_d else 0)
+        )
+        return atk if atk > 1 else 1
 
     def get_effective_defense(self):
         """Return current defense stat after buffs/debuffs."""
-        defn = self.defense
-        if self.has_status("shielded"):
-            defn += self.status_effects["shielded"][0]
-        if self.has_status("vulnerable"):
-            defn -= self.status_effects["vulnerable"][0]
-        return max(0, defn)
+        if not self._active_mask & (SHIELDED | VULNERABLE):
+            return self.defense
+
+        defn = (
+            self.defense
+            + (self.shielded_v if self.shielded_d else 0)
+            - (self.vulnerable_v if self.vulnerable_d else 0)
+        )
+        return defn if defn > 0 else 0
 
     def get_effective_evasion(self):
         """Return current evasion rate after buffs/debuffs."""
-        eva = self.evasion_chance
-        if self.has_status("evade_boost"):
-            eva += self.status_effects["evade_boost"][0]
-        if self.has_status("slowed"):
-            eva -= self.status_effects["slowed"][0]
-        return max(0.0, min(1.0, eva))
+        if not self._active_mask & (EVADE_BOOST | SLOWED):
+            return self.evasion_chance
+
+        eva = (
+            self.evasion_chance
+            + (self.evade_boost_v if self.evade_boost_d else 0)
+            - (self.slowed_v if self.slowed_d else 0)
+        )
+        return 0.0 if eva < 0.0 else (1.0 if eva > 1.0 else eva)
 
     def attack(self, opponent):
         """
@@ -95,20 +237,23 @@ class Character:
         Takes evasion and attack/defense modifiers into account.
         """
         if opponent.try_evade(self.name):
-            self.cached_attack_roll = None
+            self._roll_turn += 1
             return
 
-        damage = max(1, self.get_effective_attack() - opponent.get_effective_defense())
+        damage = self.get_effective_attack() - opponent.get_effective_defense()
+        if damage < 1:
+            damage = 1
         opponent.health -= damage
-        print(f"{self.name} attacks {opponent.name} for {damage} damage!")
-        self.cached_attack_roll = None
+        log(f"{self.name} attacks {opponent.name} for {damage} damage!")
+        self._roll_turn += 1
 
         if opponent.health <= 0:
-            print(f"{opponent.name} has been defeated!")
+            log(f"{opponent.name} has been defeated!")
 
     def is_ability_ready(self, ability):
-        """Return True if the specified ability is off cooldown."""
-        return self.cooldowns.get(ability, 0) == 0
+        """Return True if the specified ability is off cooldown (or unknown)."""
+        i = self._cd_index.get(ability)
+        return i is None or self._cds[i] == 0
 
     def use_ability(self, ability_name):
         """
@@ -120,9 +265,12 @@ class Character:
         Returns:
             bool: Whether the ability was successfully activated.
         """
-        cd = self.abilities[ability_name]["cooldown"]
-        if self.is_ability_ready(ability_name):
-            self.cooldowns[ability_name] = cd
+        i = self._cd_index[ability_name]
+        if self._cds[i] == 0:
+            cd = self.abilities[ability_name]["cooldown"]
+            self._cds[i] = cd
+            if cd:
+                self._ready.discard(ability_name)
             return True
         return False
 
@@ -134,9 +282,9 @@ class Character:
             index (int): Index of the ability (0-based).
             target (Character): The target to use the ability on.
         """
-        abilities = list(self.abilities.keys())
+        abilities = self._ability_names
         if not 0 <= index < len(abilities):
-            print("Invalid ability choice.")
+            log("Invalid ability choice.")
             return
 
         ability = abilities[index]
@@ -147,92 +295,140 @@ class Character:
         if callable(method):
             method(target)
         else:
-            print(f"{ability} is not implemented.")
+            log(f"{ability} is not implemented.")
 
     def heal(self):
         """Restore 10 HP, not exceeding maximum health."""
         amount = 10
         if self.health < self.max_health:
             self.health = min(self.max_health, self.health + amount)
-            print(f"{self.name} heals for {amount} HP. Current health: {self.health}")
+            log(f"{self.name} heals for {amount} HP. Current health: {self.health}")
         else:
-            print(f"{self.name} is already at full health!")
+            log(f"{self.name} is already at full health!")
 
     def update(self):
         """
         Update status effect durations and cooldowns.
         Call this at the end of the character's turn.
         """
-        for k, v in self.status_effects.items():
-            if isinstance(v, tuple):
-                value, duration = v
-                if duration > 0:
-                    self.status_effects[k] = (value, duration - 1)
-            elif isinstance(v, int):
-                if v > 0:
-                    self.status_effects[k] -= 1
-                if self.status_effects[k] <= 0:
-                    self.status_effects[k] = 0
-
-        for k in self.cooldowns:
-            if self.cooldowns[k] > 0:
-                self.cooldowns[k] -= 1
-
-    def display_stats(self):
-        """Print the character's current stats and active status effects."""
-        print(f"{self.name}'s Stats\n" + "-" * 40)
-
-        if self.cached_attack_roll is None:
-            self.cached_attack_roll = random.randint(
-                self.attack_power, self.attack_power + 5
-            )
-        rolled_attack = self.cached_attack_roll
+        mask = self._active_mask
+        if mask:
+            d = self.stunned
+            if d > 0:
+                self.stunned = d - 1
+                if d == 1:
+                    mask &= ~STUNNED
+            d = self.weakened_d
+            if d > 0:
+                self.weakened_d = d - 1
+                if d == 1:
+                    mask &= ~WEAKENED
+            d = self.vulnerable_d
+            if d > 0:
+                self.vulnerable_d = d - 1
+                if d == 1:
+                    mask &= ~VULNERABLE
+            d = self.slowed_d
+            if d > 0:
+                self.slowed_d = d - 1
+                if d == 1:
+                    mask &= ~SLOWED
+            d = self.shielded_d
+            if d > 0:
+                self.shielded_d = d - 1
+                if d == 1:
+                    mask &= ~SHIELDED
+            d = self.empowered_d
+            if d > 0:
+                self.empowered_d = d - 1
+                if d == 1:
+                    mask &= ~EMPOWERED
+            d = self.evade_boost_d
+            if d > 0:
+                self.evade_boost_d = d - 1
+                if d == 1:
+                    mask &= ~EVADE_BOOST
+            self._active_mask = mask
+
+        cds = self._cds
+        for i in range(len(cds)):
+            v = cds[i]
+            if v:
+                cds[i] = v - 1
+                if v == 1:
+                    self._ready.add(self._ability_names[i])
+
+    def _all_effective(self):
+        """
+        Compute every effective stat in a single pass over the status slots.
 
-        empowered = (
-            self.status_effects["empowered"][0] if self.has_status("empowered") else 0
+        Returns:
+            tuple: (attack, defense, evasion, attack_mod, defense_mod, evasion_mod),
+            where evasion_mod is in whole percentage points.
+        """
+        atk_mod = (self.empowered_v if self.empowered_d else 0) - (
+            self.weakened_v if self.weakened_d else 0
         )
-        weakened = (
-            self.status_effects["weakened"][0] if self.has_status("weakened") else 0
+        atk = self._current_roll() + atk_mod
+        defn = (
+            self.defense
+            + (self.shielded_v if self.shielded_d else 0)
+            - (self.vulnerable_v if self.vulnerable_d else 0)
         )
-        net_attack_mod = empowered - weakened
-
-        effective_def = self.get_effective_defense()
-        net_def_mod = effective_def - self.defense
-
-        effective_eva = self.get_effective_evasion()
-        net_eva_mod = round((effective_eva - self.evasion_chance) * 100)
-
-        print(f"Health       : {self.health}/{self.max_health}")
-        print(
-            f"Attack Power : {rolled_attack} ({'+' if net_attack_mod >= 0 else ''}{net_attack_mod})"
+        eva = (
+            self.evasion_chance
+            + (self.evade_boost_v if self.evade_boost_d else 0)
+            - (self.slowed_v if self.slowed_d else 0)
         )
-        print(
-            f"Defense      : {effective_def} ({'+' if net_def_mod >= 0 else ''}{net_def_mod})"
+        atk = atk if atk > 1 else 1
+        defn = defn if defn > 0 else 0
+        eva = 0.0 if eva < 0.0 else (1.0 if eva > 1.0 else eva)
+        return (
+            atk,
+            defn,
+            eva,
+            atk_mod,
+            defn - self.defense,
+            round((eva - self.evasion_chance) * 100),
         )
-        print(
-            f"Evasion      : {effective_eva * 100:.0f}% ({'+' if net_eva_mod >= 0 else ''}{net_eva_mod}%)"
+
+    def display_stats(self):
+        """Print the character's current stats and active status effects."""
+        _, effective_def, effective_eva, net_attack_mod, net_def_mod, net_eva_mod = (
+            self._all_effective()
         )
+        rolled_attack = self.cached_attack_roll
 
-        print("\nActive Status Effects:")
-        has_status = False
-        for k, v in self.status_effects.items():
-            if isinstance(v, tuple) and v[1] > 0:
-                print(f" - {k}: {v[0]} for {v[1]} more turn(s)")
-                has_status = True
-            elif isinstance(v, int) and v > 0:
-                print(f" - {k}: {v} more turn(s)")
-                has_status = True
-        if not has_status:
-            print(" - None")
+        lines = [
+            f"{self.name}'s Stats\n{'-' * 40}\n"
+            f"Health       : {self.health}/{self.max_health}\n"
+            f"Attack Power : {rolled_attack} ({net_attack_mod:+})\n"
+            f"Defense      : {effective_def} ({net_def_mod:+})\n"
+            f"Evasion      : {effective_eva * 100:.0f}% ({net_eva_mod:+}%)\n"
+            f"\nActive Status Effects:"
+        ]
+        for k in Character._INT_STATUSES:
+            duration = getattr(self, k)
+            if duration > 0:
+                lines.append(f" - {k}: {duration} more turn(s)")
+            elif duration:
+                lines.append(f" - {k}: permanent")
+        for k in Character._TUPLE_STATUSES:
+            _, value_slot, duration_slot = Character._STATUS_LAYOUT[k]
+            value, duration = getattr(self, value_slot), getattr(self, duration_slot)
+            if duration > 0:
+                lines.append(f" - {k}: {value} for {duration} more turn(s)")
+            elif duration:
+                lines.append(f" - {k}: {value} (permanent)")
+        if len(lines) == 1:
+            lines.append(" - None")
+        log("\n".join(lines))
 
     def view_special_abilities(self):
         """Print a summary of available special abilities and their cooldowns."""
-        print(f"{self.name}'s Special Abilities:")
-        for i, (name, info) in enumerate(self.abilities.items(), 1):
-            cd = info["cooldown"]
-            desc = info.get("desc", "No description.")
-            remaining = self.cooldowns.get(name, 0)
+        log(f"{self.name}'s Special Abilities:")
+        for (i, name, cd, desc, title), remaining in zip(
+            self._ability_display, self._cds
+        ):
             status = "Ready" if remaining == 0 else f"{remaining} turn(s) left"
-            print(
-                f" {i}. {name.replace('_', ' ').title()} — {desc} (CD: {cd}, {status})"
-            )
+            log(f" {i}. {title} — {desc} (CD: {cd}, {status})")
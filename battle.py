@@ -1,53 +1,83 @@
 import random
 
+from base import STUNNED, flush_log, log
+
+# Bound methods of the shared module-level generator, so random.seed() still
+# controls every roll in the game.
+_rand, _randrange = random.random, random.randrange
+
+_DIVIDER = "-" * 40
+
+# Player action menu: (label, action keyword).
+_MENU = (
+    ("View stats", "view_stats"),
+    ("View enemy stats", "view_enemy_stats"),
+    ("View special abilities", "view_special_abilities"),
+    ("Attack", "attack"),
+    ("Special", "special"),
+    ("Heal", "heal"),
+    ("Quit", "quit"),
+)
+
 
 def battle(player, enemy):
     """
     Main game loop handling turn-by-turn combat between player and enemy.
     Ends when one character's health drops to zero or the player quits.
     """
+    player_update, enemy_update = player.update, enemy.update
     while player.health > 0 and enemy.health > 0:
         print_turn_header(player, enemy)
 
-        try:
-            if player.status_effects.get("stunned", 0) > 0:
-                print(f"{player.name} is stunned and cannot act this turn!")
-            else:
+        if player._active_mask & STUNNED:
+            log(f"{player.name} is stunned and cannot act this turn!")
+        else:
+            try:
                 if not handle_player_turn(player, enemy):
+                    flush_log()
                     return
-        except Exception as e:
-            print(f"Something went wrong during your turn: {e}")
-        player.update()
-        print("\n")
-
-        try:
-            if enemy.health > 0:
-                if enemy.status_effects.get("stunned", 0) > 0:
-                    print(f"{enemy.name} is stunned and cannot act this turn!")
-                else:
+            except Exception as e:
+                log(f"Something went wrong during your turn: {e}")
+        player_update()
+        log("\n")
+
+        if enemy.health > 0:
+            if enemy._active_mask & STUNNED:
+                log(f"{enemy.name} is stunned and cannot act this turn!")
+            else:
+                try:
                     handle_enemy_turn(enemy, player)
-        except Exception as e:
-            print(f"Something went wrong during the enemy's turn: {e}")
+                except Exception as e:
+                    log(f"Something went wrong during the enemy's turn: {e}")
 
-        enemy.update()
-        print("-" * 40)
+        enemy_update()
+        log(_DIVIDER)
 
-        input("Press Enter to continue to the next turn...")
+        _prompt("Press Enter to continue to the next turn...")
 
-    print("\nBattle Over")
+    log("\nBattle Over")
     if player.health <= 0:
-        print(f"{player.name} has been defeated!")
+        log(f"{player.name} has been defeated!")
     elif enemy.health <= 0:
-        print(f"{enemy.name} has been defeated!")
+        log(f"{enemy.name} has been defeated!")
+    flush_log()
+
+
+def _prompt(msg):
+    """Flush queued combat messages, then read a line of player input."""
+    flush_log()
+    return input(msg)
 
 
 def print_turn_header(player, enemy):
     """
     Print a visual header at the beginning of each turn.
     """
-    print("\n=== New Turn ===")
-    print(f"{player.name}: {player.health} HP")
-    print(f"{enemy.name}: {enemy.health} HP\n")
+    log(
+        f"\n=== New Turn ===\n"
+        f"{player.name}: {player.health} HP\n"
+        f"{enemy.name}: {enemy.health} HP\n"
+    )
 
 
 def get_player_action(player, enemy):
@@ -57,41 +87,33 @@ def get_player_action(player, enemy):
     Returns:
         str: The selected action keyword.
     """
-    menu = [
-        ("View stats", "view_stats"),
-        ("View enemy stats", "view_enemy_stats"),
-        ("View special abilities", "view_special_abilities"),
-        ("Attack", "attack"),
-        ("Special", "special"),
-        ("Heal", "heal"),
-        ("Quit", "quit"),
-    ]
-
     while True:
-        print("\nChoose your action:")
-        for i, (label, _) in enumerate(menu, start=1):
-            print(f" {i}. {label}")
+        log("\nChoose your action:")
+        for i, (label, _) in enumerate(_MENU, start=1):
+            log(f" {i}. {label}")
 
-        choice = input("> ").strip()
+        choice = _prompt("> ").strip()
 
-        if choice.isdigit():
+        try:
             index = int(choice)
-            if 1 <= index <= len(menu):
-                action = menu[index - 1][1]
-
-                # Handle preview-only options immediately
-                if action == "view_stats":
-                    player.display_stats()
-                elif action == "view_enemy_stats":
-                    enemy.display_stats()
-                elif action == "view_special_abilities":
-                    player.view_special_abilities()
-                else:
-                    return action
+        except ValueError:
+            log("Invalid input. Please enter a number.")
+            continue
+
+        if 1 <= index <= len(_MENU):
+            action = _MENU[index - 1][1]
+
+            # Handle preview-only options immediately
+            if action == "view_stats":
+                player.display_stats()
+            elif action == "view_enemy_stats":
+                enemy.display_stats()
+            elif action == "view_special_abilities":
+                player.view_special_abilities()
             else:
-                print("Invalid choice. Please enter a number between 1 and 6.")
+                return action
         else:
-            print("Invalid input. Please enter a number.")
+            log("Invalid choice. Please enter a number between 1 and 6.")
 
 
 def handle_player_turn(player, enemy):
@@ -111,36 +133,37 @@ def handle_player_turn(player, enemy):
         elif action == "special":
             while True:
                 player.view_special_abilities()
-                ability_choice = input(
+                ability_choice = _prompt(
                     "Choose a special ability by number (or 'back' to cancel): "
                 ).strip()
 
                 if ability_choice.lower() == "back":
                     break  # Return to main action menu
 
-                if not ability_choice.isdigit():
-                    print("Invalid input. Please enter a number.")
+                try:
+                    ability_index = int(ability_choice) - 1
+                except ValueError:
+                    log("Invalid input. Please enter a number.")
                     continue
 
-                ability_index = int(ability_choice) - 1
-                if 0 <= ability_index < len(player.abilities):
-                    ability_name = list(player.abilities.keys())[ability_index]
-                    if player.is_ability_ready(ability_name):
+                if 0 <= ability_index < len(player._ability_names):
+                    ability_name = player._ability_names[ability_index]
+                    if player._cds[ability_index] == 0:
                         player.special(ability_index, enemy)
                         return True
                     else:
-                        print(
+                        log(
                             f"{ability_name.replace('_', ' ').title()} is on cooldown. Try another."
                         )
                 else:
-                    print("Invalid ability choice.")
+                    log("Invalid ability choice.")
 
         elif action == "heal":
             player.heal()
             return True
 
         elif action == "quit":
-            print("You fled the battle!")
+            log("You fled the battle!")
             return False
 
 
@@ -149,18 +172,21 @@ def handle_enemy_turn(enemy, player):
     Handles enemy AI logic for deciding whether to use a special or regular attack.
     Prioritizes specials 60% of the time if any are ready.
     """
-    if enemy.status_effects.get("stunned", 0) > 0:
-        print(f"{enemy.name} is stunned and cannot act this turn!")
+    if enemy._active_mask & STUNNED:
+        log(f"{enemy.name} is stunned and cannot act this turn!")
         return
 
-    # Get indices of all abilities that are currently ready
-    ready_specials = [
-        i for i, name in enumerate(enemy.abilities) if enemy.is_ability_ready(name)
-    ]
-
-    # 60% chance to use a special ability if at least one is ready
-    if ready_specials and random.random() < 0.6:
-        chosen_index = random.choice(ready_specials)
+    names = enemy._ability_names
+    ready = enemy._ready
+
+    # 60% chance to use a special ability if at least one is ready.
+    # Pick uniformly among the ready ones by rejection: draw any ability and
+    # retry until a ready one comes up, which avoids building a ready list.
+    if ready and _rand() < 0.6:
+        while True:
+            chosen_index = _randrange(len(names))
+            if names[chosen_index] in ready:
+                break
         enemy.special(chosen_index, player)
     else:
         enemy.attack(player)
@@ -1,5 +1,8 @@
-from base import Character
+from base import Character, log
 import random
+from types import MappingProxyType
+
+_choice, _randint = random.choice, random.randint
 
 
 class Warrior(Character):
@@ -7,21 +10,26 @@ class Warrior(Character):
     A tanky melee fighter with a passive Berserker Rage that activates at low health.
     """
 
-    def __init__(self, name):
-        abilities = {
+    __slots__ = ("raging", "_rage_threshold")
+
+    _ABILITIES = MappingProxyType(
+        {
             "shield_bash": {"cooldown": 3, "desc": "Stuns the enemy for 1 turn."}
         }
+    )
 
+    def __init__(self, name):
         super().__init__(
             name,
             health=140,
             attack_power=25,
             defense=15,
             evasion_chance=0.05,
-            abilities=abilities,
+            abilities=self._ABILITIES,
         )
 
         self.raging = False  # Track rage state
+        self._rage_threshold = self.max_health * 0.3  # max_health never changes
 
     def update(self):
         """
@@ -37,30 +45,30 @@ class Warrior(Character):
         if opponent.try_evade(self.name):
             return
 
-        opponent.status_effects["stunned"] = 1
-        print(f"{self.name} uses Shield Bash on {opponent.name}, stunning them!")
+        opponent.apply_status("stunned", 0, 1)
+        log(f"{self.name} uses Shield Bash on {opponent.name}, stunning them!")
 
     def berserker_rage(self):
         """
         Passive: If health is below 30%, gain +10 attack and +5 defense.
         Removed when health returns above 30%.
-        Implemented via status_effects, not base stat changes.
+        Implemented via status effects, not base stat changes.
         """
-        health_ratio = self.health / self.max_health
+        below = self.health < self._rage_threshold
 
-        if not self.raging and health_ratio < 0.3:
+        if not self.raging and below:
             self.apply_status("empowered", 10, -1)  # permanent while below 30%
             self.apply_status("shielded", 5, -1)
             self.raging = True
-            print(
+            log(
                 f"{self.name} enters Berserker Rage! "
                 f"Attack Power: {self.get_effective_attack()}, Defense: {self.get_effective_defense()}"
             )
-        elif self.raging and health_ratio >= 0.3:
+        elif self.raging and not below:
             self.apply_status("empowered", 0, 0)
             self.apply_status("shielded", 0, 0)
             self.raging = False
-            print(f"{self.name} calms down. Rage effect removed.")
+            log(f"{self.name} calms down. Rage effect removed.")
 
 
 class Mage(Character):
@@ -68,15 +76,20 @@ class Mage(Character):
     A glass-cannon spellcaster with powerful damage and random utility magic.
     """
 
-    def __init__(self, name):
-        abilities = {
+    __slots__ = ()
+
+    _ABILITIES = MappingProxyType(
+        {
             "arcane_surge": {"cooldown": 4, "desc": "Deals 50 damage to the enemy."},
             "random_spell": {
                 "cooldown": 5,
                 "desc": "Casts a random spell with various effects.",
             },
         }
-        super().__init__(name, 120, 30, 3, 0.1, abilities)
+    )
+
+    def __init__(self, name):
+        super().__init__(name, 120, 30, 3, 0.1, self._ABILITIES)
 
     def arcane_surge(self, opponent):
         """
@@ -87,7 +100,7 @@ class Mage(Character):
 
         damage = 50
         opponent.health -= damage
-        print(f"{self.name} casts Arcane Surge on {opponent.name} for {damage} damage!")
+        log(f"{self.name} casts Arcane Surge on {opponent.name} for {damage} damage!")
 
     def random_spell(self, opponent):
         """
@@ -98,28 +111,39 @@ class Mage(Character):
         - Boost Defense
         """
 
-        spells = ["Teleport", "Ice Shard", "Boost Attack", "Boost Defense"]
-        spell = random.choice(spells)
-        print(f"{self.name} casts {spell}!")
-
-        if spell == "Teleport":
-            self.apply_status("evade_boost", 1, 3)
-            print(f"{self.name} teleports! +100% evasion for 2 turns.")
-        elif spell == "Ice Shard":
-            if opponent.try_evade(self.name):
-                return
-            damage = 20
-            opponent.status_effects["slowed"] = (opponent.evasion_chance / 2, 4)
-            opponent.health -= damage
-            print(
-                f"{self.name} hits {opponent.name} with Ice Shard for {damage} damage. Target is slowed for 3 turns."
-            )
-        elif spell == "Boost Attack":
-            self.apply_status("empowered", 7, 2)
-            print(f"{self.name}'s attack power is boosted by 7 for 1 turn!")
-        elif spell == "Boost Defense":
-            self.apply_status("shielded", 5, 2)
-            print(f"{self.name}'s defense increases by 5 for 1 turn!")
+        spell, cast = _choice(self._SPELLS)
+        log(f"{self.name} casts {spell}!")
+        cast(self, opponent)
+
+    def _teleport(self, opponent):
+        self.apply_status("evade_boost", 1, 3)
+        log(f"{self.name} teleports! +100% evasion for 2 turns.")
+
+    def _ice_shard(self, opponent):
+        if opponent.try_evade(self.name):
+            return
+        damage = 20
+        opponent.apply_status("slowed", opponent.evasion_chance / 2, 4)
+        opponent.health -= damage
+        log(
+            f"{self.name} hits {opponent.name} with Ice Shard for {damage} damage. Target is slowed for 3 turns."
+        )
+
+    def _boost_attack(self, opponent):
+        self.apply_status("empowered", 7, 2)
+        log(f"{self.name}'s attack power is boosted by 7 for 1 turn!")
+
+    def _boost_defense(self, opponent):
+        self.apply_status("shielded", 5, 2)
+        log(f"{self.name}'s defense increases by 5 for 1 turn!")
+
+    # Spell name -> handler, picked from by random_spell.
+    _SPELLS = (
+        ("Teleport", _teleport),
+        ("Ice Shard", _ice_shard),
+        ("Boost Attack", _boost_attack),
+        ("Boost Defense", _boost_defense),
+    )
 
 
 class Archer(Character):
@@ -127,15 +151,20 @@ class Archer(Character):
     A high-damage ranged fighter with multi-hit and power-shot abilities.
     """
 
-    def __init__(self, name):
-        abilities = {
+    __slots__ = ()
+
+    _ABILITIES = MappingProxyType(
+        {
             "multi_shot": {
                 "cooldown": 3,
                 "desc": "Hits 3-5 times for a third damage each.",
             },
             "headshot": {"cooldown": 4, "desc": "Next attack deals double damage."},
         }
-        super().__init__(name, 120, 35, 7, 0.15, abilities)
+    )
+
+    def __init__(self, name):
+        super().__init__(name, 120, 35, 7, 0.15, self._ABILITIES)
 
     def multi_shot(self, opponent):
         """
@@ -143,19 +172,21 @@ class Archer(Character):
         Good against low-defense targets.
         """
 
-        hits = random.randint(3, 5)
+        hits = _randint(3, 5)
         damage_per_hit = self.attack_power // 3
-        landed = 0
-        total_damage = 0
 
+        # Evasion cannot change mid-volley, so read it once and roll each
+        # arrow against it instead of calling try_evade per hit.
+        evasion = opponent.get_effective_evasion()
+        landed = 0
         for _ in range(hits):
-            if opponent.try_evade(self.name):
-                continue
-            opponent.health -= damage_per_hit
-            total_damage += damage_per_hit
-            landed += 1
+            if not opponent._roll_evade(evasion, self.name):
+                landed += 1
 
-        print(
+        total_damage = landed * damage_per_hit
+        opponent.health -= total_damage
+
+        log(
             f"{self.name} uses Multi-Shot on {opponent.name}, "
             f"attempting {hits} hits, {landed} landed for a total of {total_damage} damage!"
         )
@@ -167,7 +198,7 @@ class Archer(Character):
         """
 
         self.apply_status("empowered", self.attack_power, 2)
-        print(
+        log(
             f"{self.name} is lining up a Headshot! Next attack will deal double damage."
         )
 
@@ -177,8 +208,10 @@ class Assassin(Character):
     A stealthy fighter with high evasion and abilities to bypass defenses.
     """
 
-    def __init__(self, name):
-        abilities = {
+    __slots__ = ()
+
+    _ABILITIES = MappingProxyType(
+        {
             "shadow_step": {
                 "cooldown": 3,
                 "desc": "Next attack hits with 1.5x power and bypasses evasion.",
@@ -188,7 +221,10 @@ class Assassin(Character):
                 "desc": "Increases evasion to 75% for 2 turns.",
             },
         }
-        super().__init__(name, 100, 40, 2, 0.25, abilities)
+    )
+
+    def __init__(self, name):
+        super().__init__(name, 100, 40, 2, 0.25, self._ABILITIES)
 
     def shadow_step(self, opponent):
         """
@@ -196,8 +232,8 @@ class Assassin(Character):
         """
 
         self.apply_status("empowered", self.attack_power * 0.5, 2)
-        opponent.status_effects["evade_boost"] = (0, 2)  # Removes evasion
-        print(
+        opponent.apply_status("evade_boost", 0, 2)  # Removes evasion
+        log(
             f"{self.name} uses Shadow Step! Next attack is empowered and unavoidable."
         )
 
@@ -208,4 +244,4 @@ class Assassin(Character):
         """
 
         self.apply_status("evade_boost", 0.75, 3)
-        print(f"{self.name} uses Smoke Bomb! Evasion increased to 75% for 2 turns.")
+        log(f"{self.name} uses Smoke Bomb! Evasion increased to 75% for 2 turns.")
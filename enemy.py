@@ -1,4 +1,5 @@
-from base import Character
+from base import Character, log
+from types import MappingProxyType
 
 
 class EvilWizard(Character):
@@ -7,6 +8,17 @@ class EvilWizard(Character):
     Specializes in draining life and avoiding attacks via shadow magic.
     """
 
+    __slots__ = ()
+
+    _ABILITIES = MappingProxyType(
+        {
+            "shadow_veil": {"cooldown": 5, "desc": "Evasion +50% for 2 turns"},
+            "dark_bolt": {"cooldown": 3, "desc": "Deals magic damage"},
+            "drain_life": {"cooldown": 3, "desc": "Steals life"},
+            "curse": {"cooldown": 5, "desc": "Reduces target attack by 10"},
+        }
+    )
+
     def __init__(self, name):
         """
         Initialize the Evil Wizard with custom stats and abilities.
@@ -17,20 +29,13 @@ class EvilWizard(Character):
             - curse: Reduce enemy's attack.
             - shadow_veil: Temporarily boost evasion.
         """
-        abilities = {
-            "shadow_veil": {"cooldown": 5, "desc": "Evasion +50% for 2 turns"},
-            "dark_bolt": {"cooldown": 3, "desc": "Deals magic damage"},
-            "drain_life": {"cooldown": 3, "desc": "Steals life"},
-            "curse": {"cooldown": 5, "desc": "Reduces target attack by 10"},
-        }
-
         super().__init__(
             name,
             health=150,
             attack_power=15,
             defense=5,
             evasion_chance=0.25,
-            abilities=abilities,
+            abilities=self._ABILITIES,
         )
 
     def update(self):
@@ -45,10 +50,10 @@ class EvilWizard(Character):
             return
 
         damage = self.attack_power + 10
-        print(f"{self.name} casts Dark Bolt on {target.name} for {damage} damage.")
+        log(f"{self.name} casts Dark Bolt on {target.name} for {damage} damage.")
         target.health -= damage
         if target.health <= 0:
-            print(f"{target.name} has been defeated!")
+            log(f"{target.name} has been defeated!")
 
     def drain_life(self, target):
         """
@@ -61,9 +66,9 @@ class EvilWizard(Character):
         heal = damage // 2
         target.health -= damage
         self.health = min(self.max_health, self.health + heal)
-        print(f"{self.name} drains {damage} HP from {target.name}, healing for {heal}.")
+        log(f"{self.name} drains {damage} HP from {target.name}, healing for {heal}.")
         if target.health <= 0:
-            print(f"{target.name} has been defeated!")
+            log(f"{target.name} has been defeated!")
 
     def curse(self, target):
         """
@@ -73,8 +78,8 @@ class EvilWizard(Character):
             return
 
         reduction = 10
-        target.status_effects["weakened"] = (reduction, 4)
-        print(
+        target.apply_status("weakened", reduction, 4)
+        log(
             f"{self.name} curses {target.name}, reducing their attack power by {reduction}."
         )
 
@@ -85,8 +90,8 @@ class EvilWizard(Character):
 
         boost = 0.5
         duration = 3
-        self.status_effects["evade_boost"] = (boost, duration)
-        print(
+        self.apply_status("evade_boost", boost, duration)
+        log(
             f"{self.name} shrouds themselves in shadows, increasing evasion by {int(boost * 100)}% for {duration} turns."
         )
 
@@ -96,7 +101,9 @@ class EvilWizard(Character):
         """
         if self.health <= 0:
             return  # Do not regenerate if already defeated
+        if self.health >= self.max_health:
+            return  # Nothing to heal, so skip the message too
 
         heal = 5
         self.health = min(self.max_health, self.health + heal)
-        print(f"{self.name} passively regenerates {heal} HP. Now at {self.health} HP.")
+        log(f"{self.name} passively regenerates {heal} HP. Now at {self.health} HP.")
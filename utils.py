@@ -1,36 +1,33 @@
 from characters import Warrior, Mage, Archer, Assassin
 
+_CLASS_TABLE = {1: Warrior, 2: Mage, 3: Archer, 4: Assassin}
+_SEPARATOR = "-" * 40
+_MENU = (
+    "Choose your character class:\n"
+    "1. Warrior\n2. Mage\n3. Archer\n4. Assassin\n5. Exit"
+)
 
-def create_character():
+
+def create_character(_input=input, _print=print, _exit=exit):
     while True:
-        print("Choose your character class:")
-        print("1. Warrior\n2. Mage\n3. Archer\n4. Assassin\n5. Exit")
+        _print(_MENU)
         try:
-            choice = int(input("Enter number: ").strip())
+            choice = int(_input("Enter number: ").strip())
             if choice == 5:
-                print("Exiting game. Goodbye!")
-                exit()
-            name = input("Enter your name: ")
-        except TypeError:
-            print("Invalid input. Please enter a number corresponding to your choice.")
+                _print("Exiting game. Goodbye!")
+                _exit()
+            name = _input("Enter your name: ")
+        except ValueError:
+            _print("Invalid input. Please enter a number corresponding to your choice.")
             continue
         except KeyboardInterrupt:
-            print("\nCharacter creation cancelled. Exiting game.")
-            exit()
+            _print("\nCharacter creation cancelled. Exiting game.")
+            _exit()
         else:
-            if choice < 1 or choice > 5:
-                print("Invalid choice. Defaulting to Warrior.")
-                return Warrior(name)
-            elif choice == 1:
-                return Warrior(name)
-            elif choice == 2:
-                return Mage(name)
-            elif choice == 3:
-                return Archer(name)
-            elif choice == 4:
-                return Assassin(name)
-            else:
-                print("Invalid choice. Defaulting to Warrior.")
-                return Warrior(name)
+            cls = _CLASS_TABLE.get(choice)
+            if cls is None:
+                _print("Invalid choice. Defaulting to Warrior.")
+                cls = Warrior
+            return cls(name)
         finally:
-            print("-" * 40)
+            _print(_SEPARATOR)